@@ -1,40 +1,131 @@
 import os
-import csv
 import argparse
+import shutil
+import hashlib
+import functools
+import warnings
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import sweetviz as sv
 from ydata_profiling import ProfileReport
+import plotly
 import plotly.express as px
+from kaleido.scopes.plotly import PlotlyScope
+from threadpoolctl import threadpool_limits
 
 from rich.console import Console
 from rich import print
 from rich.table import Table
 
 console = Console()
+# Chromium starts on first use and is then reused for every static export in this process.
+# Point it at plotly's own bundle: Kaleido 0.2's built-in plotly.js can't decode plotly 6 figures.
+plotly_scope = PlotlyScope(
+    plotlyjs=os.path.join(os.path.dirname(plotly.__file__), "package_data", "plotly.min.js"))
 
 # -------------------- Config --------------------
 DEFAULT_SAMPLE_SIZE = 500
+PROFILE_SAMPLE_SIZE = 200_000  # rows fed to ProfileReport / Sweetviz; 0 = full frame
 MISSING_THRESHOLD = 0.3
+CATEGORY_RATIO = 0.5  # string columns below this unique/row ratio become 'category'
 REPORTS_DIR = "reports"
+CACHE_DIR = ".cache"
+LOADER_CACHE_VERSION = 2  # bump whenever _read_csv's output can change, so old pickles miss
+CSV_BLOCK_SIZE = 8 << 20  # 8 MB per parse block for the Arrow reader
+CANDIDATE_DELIMITERS = (',', ';', '\t', '|')
+INFERENCE_SAMPLE_SIZE = 1000
+TEXT_SAMPLE_SIZE = 500
+TEXT_MIN_MEAN_LEN = 40
+CORR_TILE_COLS = 1024
+WORKER_BLAS_THREADS = 2
+STREAM_CHUNK_ROWS = 2 << 20  # ~2M rows per chunk in --stream mode
+FACET_COLS = 3
+FACET_HEIGHT = 350  # px per row of categorical facets
+STATIC_WIDTH, STATIC_HEIGHT = 1200, 800  # PNG export size (--static)
+DATE_FORMAT = "%Y-%m-%d"
+
+STRING_DTYPE = pd.StringDtype(storage="pyarrow")
+
+# Plain string: Arrow-backed columns hand it to Arrow's own regex engine
+_DATE_RE = r"^\d{4}-\d{2}-\d{2}"
+_DATE_DIGIT_POS = [0, 1, 2, 3, 5, 6, 8, 9]
+
+# -------------------- Disk Cache --------------------
+def frame_key(df):
+    h = hashlib.sha256(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    h.update("\x1f".join(map(str, df.columns)).encode())
+    return h.hexdigest()[:16]
+
+def _text_key(*parts):
+    return hashlib.sha256("\x1f".join(map(str, parts)).encode()).hexdigest()[:16]
+
+def _cache_path(key, ext):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return os.path.join(CACHE_DIR, f"{key}.{ext}")
+
+def _cache_write(path, write):
+    # Write-then-rename so concurrent --all workers never see a half-written entry
+    tmp = f"{path}.{os.getpid()}.tmp"
+    write(tmp)
+    os.replace(tmp, path)
+
+def _cached_frame(key, compute):
+    path = _cache_path(key, "pkl")
+    if os.path.exists(path):
+        try:
+            return pd.read_pickle(path)
+        except Exception as e:
+            # Corrupt or incompatible entry: treat as a miss and overwrite it below
+            console.log(f"[yellow]⚠️ Ignoring unreadable cache entry[/] {path}: {e}")
+    df = compute()
+    if df is not None:
+        _cache_write(path, df.to_pickle)
+    return df
 
 # -------------------- Auto Delimiter --------------------
+@functools.lru_cache(maxsize=256)
+def _sniff(sample_bytes):
+    # Plain byte counting instead of csv.Sniffer's regex pass; ties go to ','
+    counts = {d: sample_bytes.count(d.encode()) for d in CANDIDATE_DELIMITERS}
+    best = max(counts, key=counts.get)
+    return best if counts[best] else ','  # fallback
+
 def detect_delimiter(file_path, sample_size=2048):
-    with open(file_path, 'r', encoding='utf-8') as f:
-        sample = f.read(sample_size)
-        sniffer = csv.Sniffer()
-        try:
-            dialect = sniffer.sniff(sample)
-            return dialect.delimiter
-        except csv.Error:
-            return ','  # fallback
+    with open(file_path, 'rb') as f:
+        return _sniff(f.read(sample_size))
 
 # -------------------- Data Load --------------------
-def load_dataset(file_path):
+def _read_csv(file_path, delimiter):
+    table = pa_csv.read_csv(
+        file_path,
+        parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+        read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_SIZE, use_threads=True),
+        # Arrow keeps empty/"NA" string cells as literal text by default; pandas treats them as missing
+        convert_options=pa_csv.ConvertOptions(strings_can_be_null=True,
+                                              quoted_strings_can_be_null=True),
+    )
+    # Strings stay in Arrow buffers so .str ops run as Arrow compute kernels;
+    # numerics keep NumPy dtypes so they can be downcast and handed to BLAS
+    arrow_strings = {pa.string(): STRING_DTYPE, pa.large_string(): STRING_DTYPE}
+    return table.to_pandas(date_as_object=False, types_mapper=arrow_strings.get)
+
+def load_dataset(file_path, delimiter=None, use_cache=True):
     try:
-        delimiter = detect_delimiter(file_path)
-        df = pd.read_csv(file_path, sep=delimiter)
+        delimiter = delimiter or detect_delimiter(file_path)
+        if use_cache:
+            stat = os.stat(file_path)
+            key = _text_key(LOADER_CACHE_VERSION, os.path.abspath(file_path),
+                            stat.st_size, stat.st_mtime_ns, delimiter)
+            df = _cached_frame(key, lambda: _read_csv(file_path, delimiter))
+        else:
+            df = _read_csv(file_path, delimiter)
         console.log(f"✅ Loaded: [green]{file_path}[/] with delimiter '[cyan]{delimiter}[/]'")
         return df
     except Exception as e:
@@ -50,22 +141,67 @@ def create_output_dir(dataset_name):
     return output_path
 
 # -------------------- Smart Conversion --------------------
+def _is_str_column(s):
+    return s.dtype == object or isinstance(s.dtype, pd.StringDtype)
+
+def _iso_date_ratio(s):
+    # Fixed-width byte view: truncating to 10 bytes keeps the prefix-match semantics
+    # of _DATE_RE, and the check becomes a few byte compares over one (n, 10) block
+    try:
+        arr = s.to_numpy(dtype=str).astype('S10')
+    except UnicodeEncodeError:
+        return s.str.match(_DATE_RE, na=False).mean()
+    b = np.frombuffer(arr.tobytes(), dtype=np.uint8).reshape(-1, 10)
+    digits = (b[:, _DATE_DIGIT_POS] >= ord('0')) & (b[:, _DATE_DIGIT_POS] <= ord('9'))
+    ok = digits.all(axis=1) & (b[:, 4] == ord('-')) & (b[:, 7] == ord('-'))
+    return ok.mean()
+
+def _infer_conversion(s):
+    s = s.dropna().head(INFERENCE_SAMPLE_SIZE)
+    if s.empty:
+        return None
+    if len(str(s.iloc[0])) == 10 and _iso_date_ratio(s) > 0.7:
+        return "date"
+    if pd.to_numeric(s, errors='coerce').notna().mean() > 0.9:
+        return "id"
+    return None
+
 def smart_convert_columns(df):
     for col in df.columns:
-        if df[col].dtype == object:
-            if df[col].str.match(r"\d{4}-\d{2}-\d{2}").sum() > 0.7 * len(df):
-                df[col] = pd.to_datetime(df[col], errors='ignore')
-            elif df[col].str.match(r"^\d+$").sum() > 0.9 * len(df):
-                df[col] = df[col].astype(str)
+        if _is_str_column(df[col]):
+            kind = _infer_conversion(df[col])
+            if kind == "date":
+                df[col] = pd.to_datetime(df[col], format=DATE_FORMAT, errors='coerce')
+            elif kind == "id":
+                df[col] = df[col].astype(STRING_DTYPE)
+    return df
+
+# -------------------- Dtype Compaction --------------------
+def compact_dtypes(df):
+    for col in df.columns:
+        kind = df[col].dtype.kind
+        if kind in "iu":
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+        elif kind == "f":
+            df[col] = pd.to_numeric(df[col], downcast='float')
+        elif _is_str_column(df[col]) and df[col].nunique(dropna=False) < CATEGORY_RATIO * len(df):
+            df[col] = df[col].astype('category')
     return df
 
 # -------------------- Column Type Summary --------------------
+TypeIndex = namedtuple("TypeIndex", ["num", "cat", "text", "date"])
+
+def _is_text(s):
+    # Mean length of a head sample is enough to tell free text from labels
+    sample = s.dropna().head(TEXT_SAMPLE_SIZE)
+    return not sample.empty and sample.astype(str).str.len().mean() > TEXT_MIN_MEAN_LEN
+
 def summarize_column_types(df):
-    num_cols = df.select_dtypes(include=['int64', 'float64']).columns.tolist()
-    cat_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
-    date_cols = df.select_dtypes(include=['datetime64']).columns.tolist()
-    text_cols = [col for col in cat_cols if df[col].str.len().mean() > 40]
-    return num_cols, cat_cols, text_cols, date_cols
+    num_cols = df.select_dtypes(include='number').columns.tolist()
+    cat_cols = df.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
+    date_cols = df.select_dtypes(include=['datetime64', 'datetimetz']).columns.tolist()
+    text_cols = [col for col in cat_cols if _is_text(df[col])]
+    return TypeIndex(num_cols, cat_cols, text_cols, date_cols)
 
 def print_column_type_table(num, cat, text, date):
     table = Table(title="📋 Column Type Summary")
@@ -81,7 +217,15 @@ def print_column_type_table(num, cat, text, date):
 
 # -------------------- Missing Values --------------------
 def check_missing_values(df):
-    missing = df.isnull().mean().sort_values(ascending=False)
+    if df.empty:
+        return
+    # One boolean reduction over the whole block; only the flagged columns get sorted
+    pct = df.isna().to_numpy().sum(axis=0) / len(df)
+    mask = pct > MISSING_THRESHOLD
+    order = np.argsort(-pct[mask], kind='stable')
+    print_high_missing(pd.Series(pct[mask][order], index=df.columns[mask][order]))
+
+def print_high_missing(missing):
     high_missing = missing[missing > MISSING_THRESHOLD]
     if not high_missing.empty:
         console.print(f"[red]⚠️ High missing value columns (> {MISSING_THRESHOLD:.0%}):[/]")
@@ -95,68 +239,261 @@ def save_samples(df, output_path, dataset_name):
     console.log(f"🧪 Sample saved: [green]{sample_path}[/]")
 
 # -------------------- Reports --------------------
-def generate_profile_report(df, output_path, dataset_name):
+def _report_sample(df, sample_size):
+    # Deterministic so re-runs profile the same rows
+    if sample_size and len(df) > sample_size:
+        console.log(f"✂️ Profiling a [cyan]{sample_size:,}[/]-row sample of {len(df):,} rows")
+        return df.sample(n=sample_size, random_state=0)
+    return df
+
+def generate_profile_report(df, output_path, dataset_name, sample_size=PROFILE_SAMPLE_SIZE,
+                            use_cache=True):
     console.log("📊 Generating [cyan]pandas profiling[/] report...")
-    profile = ProfileReport(df, title=f"{dataset_name} Profiling Report", explorative=True)
-    profile.to_file(f"{output_path}/{dataset_name}_profiling.html")
+    sample = _report_sample(df, sample_size)
+    title = f"{dataset_name} Profiling Report"
+    report_path = f"{output_path}/{dataset_name}_profiling.html"
+    if not use_cache:
+        ProfileReport(sample, title=title, explorative=True).to_file(report_path, silent=True)
+        console.log(f"✅ Profiling saved")
+        return
+    cache_path = _cache_path(_text_key(frame_key(sample), title), "html")
+    if os.path.exists(cache_path):
+        console.log("♻️ Reusing cached profiling report")
+    else:
+        html = ProfileReport(sample, title=title, explorative=True).to_html()
+        _cache_write(cache_path, lambda tmp: Path(tmp).write_text(html, encoding='utf-8'))
+    shutil.copyfile(cache_path, report_path)
     console.log(f"✅ Profiling saved")
 
-def generate_sweetviz_report(df, output_path, dataset_name):
+def generate_sweetviz_report(df, output_path, dataset_name, sample_size=PROFILE_SAMPLE_SIZE):
     console.log("📈 Generating [magenta]Sweetviz[/] report...")
-    report = sv.analyze(df)
+    report = sv.analyze(_report_sample(df, sample_size))
     report.show_html(f"{output_path}/{dataset_name}_sweetviz.html")
     console.log(f"✅ Sweetviz saved")
 
+def generate_fast_profile(file_path, output_path, dataset_name, delimiter=None):
+    # Rust profiler streams the file itself, so nothing is loaded into pandas
+    import dataprof
+    console.log("⚡ Generating [cyan]dataprof[/] report...")
+    dataprof.profile(file_path, csv_delimiter=delimiter).save(
+        f"{output_path}/{dataset_name}_profiling.html")
+    console.log(f"✅ Profiling saved")
+
 # -------------------- Visuals --------------------
-def generate_correlation_heatmap(df, output_path, dataset_name):
-    num_df = df.select_dtypes(include=['int64', 'float64'])
+def write_figure(fig, path_stem, static=False, **html_kwargs):
+    if static:
+        png = plotly_scope.transform(fig, format='png', width=STATIC_WIDTH,
+                                     height=fig.layout.height or STATIC_HEIGHT)
+        with open(f"{path_stem}.png", 'wb') as f:
+            f.write(png)
+    else:
+        fig.write_html(f"{path_stem}.html", **html_kwargs)
+
+def _gram(A, B):
+    # A.T @ B, tiled for very wide frames so each block's operands stay cache-resident
+    k = A.shape[1]
+    if k <= CORR_TILE_COLS:
+        return A.T @ B
+    G = np.empty((k, k), dtype=A.dtype)
+    for i in range(0, k, CORR_TILE_COLS):
+        for j in range(0, k, CORR_TILE_COLS):
+            G[i:i + CORR_TILE_COLS, j:j + CORR_TILE_COLS] = \
+                A[:, i:i + CORR_TILE_COLS].T @ B[:, j:j + CORR_TILE_COLS]
+    return G
+
+def pearson_corr(num_df):
+    # Standardise once, then float32 GEMMs instead of pandas' column-pair loop.
+    # Moments are taken in float64: large offsets would swamp float32 before centering.
+    X = num_df.to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+    present = ~np.isnan(X)
+    X -= np.nanmean(X, axis=0)
+    std = np.nanstd(X, axis=0)
+    constant = ~(std > 0)
+    std[constant] = 1.0
+    X /= std
+    Z = np.where(present, X, 0.0).astype(np.float32)
+
+    if present.all():
+        C = _gram(Z, Z).astype(np.float64) / Z.shape[0]
+    else:
+        # Pairwise-complete like DataFrame.corr(): every (i, j) only uses rows where
+        # both columns are present, via presence-mask GEMMs (same sums as _PairwiseMoments)
+        M = present.astype(np.float32)
+        n = _gram(M, M).astype(np.float64)
+        sx = _gram(Z, M).astype(np.float64)  # sx[i, j]: sum of col i over rows where j is present
+        sxx = _gram(Z * Z, M).astype(np.float64)
+        sxy = _gram(Z, Z).astype(np.float64)
+        sy, syy = sx.T, sxx.T
+        var = (n * sxx - sx ** 2) * (n * syy - sy ** 2)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            C = (n * sxy - sx * sy) / np.sqrt(var)
+        C[~(var > 0)] = np.nan
+    C = np.clip(C, -1.0, 1.0)
+    C[constant, :] = np.nan
+    C[:, constant] = np.nan
+    return pd.DataFrame(C, index=num_df.columns, columns=num_df.columns)
+
+def generate_correlation_heatmap(num_df, output_path, dataset_name, static=False):
     if num_df.empty:
         console.print(f"[yellow]⚠️ No numerical columns to plot correlation heatmap.[/]")
         return
-    fig = px.imshow(num_df.corr(), text_auto=True, aspect="auto",
+    save_correlation_heatmap(pearson_corr(num_df), output_path, dataset_name, static)
+
+def save_correlation_heatmap(corr, output_path, dataset_name, static=False):
+    fig = px.imshow(corr, text_auto=True, aspect="auto",
                     color_continuous_scale="RdBu", title="Correlation Heatmap")
-    fig.write_html(f"{output_path}/viz/{dataset_name}_correlation_heatmap.html")
+    write_figure(fig, f"{output_path}/viz/{dataset_name}_correlation_heatmap", static)
     console.log(f"🎨 Correlation heatmap saved")
 
-def plot_categorical_distributions(df, cat_cols, output_path, dataset_name):
+def plot_categorical_distributions(df, cat_cols, output_path, dataset_name, static=False):
+    # One tidy frame -> one faceted figure, so plotly.js is referenced once instead of per column
+    frames = []
     for col in cat_cols:
-        if df[col].nunique() <= 20:
-            fig = px.bar(df[col].value_counts().reset_index(),
-                         x='index', y=col,
-                         labels={'index': col, col: "Count"},
-                         title=f"Distribution of {col}")
-            fig.update_traces(textposition='outside')
-            fig.write_html(f"{output_path}/viz/{dataset_name}_{col}_bar.html")
+        vc = df[col].value_counts(dropna=True)
+        if len(vc) <= 20:
+            frames.append(pd.DataFrame({'value': vc.index.astype(str),
+                                        'count': vc.to_numpy(),
+                                        'column': col}))
+    if not frames:
+        console.print(f"[yellow]⚠️ No low-cardinality categorical columns to plot.[/]")
+        return
+    long_df = pd.concat(frames, ignore_index=True)
+
+    rows = -(-len(frames) // FACET_COLS)
+    fig = px.bar(long_df, x='value', y='count',
+                 facet_col='column', facet_col_wrap=FACET_COLS,
+                 facet_row_spacing=min(0.1, 0.5 / rows),
+                 title=f"Categorical Distributions – {dataset_name}",
+                 height=FACET_HEIGHT * rows)
+    fig.update_xaxes(matches=None, showticklabels=True, title_text=None)
+    fig.update_yaxes(matches=None, showticklabels=True)
+    fig.for_each_annotation(lambda a: a.update(text=a.text.split("=", 1)[-1]))
+    write_figure(fig, f"{output_path}/viz/{dataset_name}_categorical_bars", static,
+                 include_plotlyjs='cdn', full_html=True)
     console.log(f"📊 Categorical bar charts saved")
 
+# -------------------- Streaming EDA --------------------
+class _PairwiseMoments:
+    # Pairwise-complete sufficient statistics, matching DataFrame.corr()'s NaN handling
+    def __init__(self, k, shift):
+        self.shift = shift  # first-chunk means; centering keeps the sums well conditioned
+        self.n = np.zeros((k, k))
+        self.sx = np.zeros((k, k))
+        self.sxx = np.zeros((k, k))
+        self.sxy = np.zeros((k, k))
+
+    def update(self, X):
+        present = ~np.isnan(X)
+        M = present.astype(np.float64)
+        Z = np.where(present, X - self.shift, 0.0)
+        self.n += M.T @ M
+        self.sx += Z.T @ M          # sx[i, j]: sum of col i over rows where j is present
+        self.sxx += (Z * Z).T @ M
+        self.sxy += Z.T @ Z
+
+    def corr(self):
+        sy, syy = self.sx.T, self.sxx.T
+        cov = self.n * self.sxy - self.sx * sy
+        var = (self.n * self.sxx - self.sx ** 2) * (self.n * syy - sy ** 2)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            r = cov / np.sqrt(var)
+        r[~(var > 0)] = np.nan
+        return np.clip(r, -1.0, 1.0)
+
+def run_eda_streaming(file_path, delimiter=None, static=False):
+    dataset_name = os.path.splitext(os.path.basename(file_path))[0]
+    delimiter = delimiter or detect_delimiter(file_path)
+    console.log(f"🌊 Streaming [green]{file_path}[/] in {STREAM_CHUNK_ROWS:,}-row chunks")
+
+    rows, na_counts, num_cols, moments = 0, None, None, None
+    for chunk in pd.read_csv(file_path, sep=delimiter, chunksize=STREAM_CHUNK_ROWS):
+        if num_cols is None:
+            num_cols = chunk.select_dtypes(include='number').columns
+            na_counts = pd.Series(0, index=chunk.columns)
+        rows += len(chunk)
+        na_counts = na_counts.add(chunk.isna().sum(), fill_value=0)
+        if len(num_cols):
+            # A later chunk may hold stray text in a numeric column; treat it as missing
+            X = chunk[num_cols].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+            if moments is None:
+                # An all-NaN column in the first chunk just gets a zero shift
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", RuntimeWarning)
+                    shift = np.nan_to_num(np.nanmean(X, axis=0))
+                moments = _PairwiseMoments(len(num_cols), shift)
+            moments.update(X)
+
+    if not rows:
+        console.print(f"[yellow]⚠️ No rows found in:[/] {file_path}")
+        return
+
+    output_path = create_output_dir(dataset_name)
+    print_high_missing((na_counts / rows).sort_values(ascending=False))
+    if moments is None:
+        console.print(f"[yellow]⚠️ No numerical columns to plot correlation heatmap.[/]")
+    else:
+        corr = pd.DataFrame(moments.corr(), index=num_cols, columns=num_cols)
+        save_correlation_heatmap(corr, output_path, dataset_name, static)
+
+    console.print(f"\n[bold green]✅ Streaming EDA complete for:[/] {dataset_name} ({rows:,} rows)\n")
+
 # -------------------- Run EDA --------------------
 def run_eda(file_path, args):
+    if args.stream:
+        run_eda_streaming(file_path, delimiter=args.delimiter, static=args.static)
+        return
+
     dataset_name = os.path.splitext(os.path.basename(file_path))[0]
-    df = load_dataset(file_path)
+    if args.fast:
+        generate_fast_profile(file_path, create_output_dir(dataset_name), dataset_name, args.delimiter)
+        console.print(f"\n[bold green]✅ Fast profile complete for:[/] {dataset_name}\n")
+        return
+
+    df = load_dataset(file_path, delimiter=args.delimiter, use_cache=not args.no_cache)
     if df is None:
         return
 
     df = smart_convert_columns(df)
+    df = compact_dtypes(df)
     output_path = create_output_dir(dataset_name)
 
-    num, cat, text, date = summarize_column_types(df)
-    print_column_type_table(num, cat, text, date)
+    # One dtype walk per run; downstream steps reuse these column lists
+    types = summarize_column_types(df)
+    print_column_type_table(*types)
     check_missing_values(df)
 
     if not args.skip_profile:
-        generate_profile_report(df, output_path, dataset_name)
+        generate_profile_report(df, output_path, dataset_name, args.profile_sample,
+                                use_cache=not args.no_cache)
 
     if not args.skip_sweetviz:
-        generate_sweetviz_report(df, output_path, dataset_name)
+        generate_sweetviz_report(df, output_path, dataset_name, args.profile_sample)
 
     if not args.skip_sample:
         save_samples(df, output_path, dataset_name)
 
-    generate_correlation_heatmap(df, output_path, dataset_name)
-    plot_categorical_distributions(df, cat, output_path, dataset_name)
+    generate_correlation_heatmap(df[types.num], output_path, dataset_name, args.static)
+    plot_categorical_distributions(df, types.cat, output_path, dataset_name, args.static)
 
     console.print(f"\n[bold green]✅ All EDA complete for:[/] {dataset_name}\n")
 
+# -------------------- Batch Mode --------------------
+def _init_worker():
+    # Each worker already gets a core; keep BLAS from fanning out on top of that
+    os.environ["OMP_NUM_THREADS"] = str(WORKER_BLAS_THREADS)
+    threadpool_limits(limits=WORKER_BLAS_THREADS)
+
+def run_eda_wrapper(file_path, args):
+    try:
+        run_eda(file_path, args)
+    except Exception as e:
+        console.print(f"[bold red]❌ EDA failed for:[/] {file_path}\n{e}")
+
+def run_eda_all(files, args):
+    workers = min(len(files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as ex:
+        list(ex.map(functools.partial(run_eda_wrapper, args=args), files))
+
 # -------------------- CLI --------------------
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="🔥 Visual + Modular EDA Script")
@@ -165,13 +502,25 @@ if __name__ == "__main__":
     parser.add_argument("--skip-profile", action="store_true", help="Skip Pandas Profiling")
     parser.add_argument("--skip-sweetviz", action="store_true", help="Skip Sweetviz")
     parser.add_argument("--skip-sample", action="store_true", help="Skip Sample CSV Export")
+    parser.add_argument("--delimiter", type=str, default=None,
+                        help="Column delimiter (skips auto-detection)")
+    parser.add_argument("--profile-sample", type=int, default=PROFILE_SAMPLE_SIZE,
+                        help="Max rows used for Profiling/Sweetviz (0 = all rows)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Chunked pass for files larger than RAM (missing values + correlation only)")
+    parser.add_argument("--static", action="store_true",
+                        help="Export charts as PNG via Kaleido instead of interactive HTML")
+    parser.add_argument("--fast", action="store_true",
+                        help="Profile with the Rust-based dataprof backend only (no pandas load)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Don't read or write the {CACHE_DIR}/ frame and report cache")
 
     args = parser.parse_args()
 
     if args.all:
-        files = [f for f in os.listdir("data/raw") if f.endswith(".csv")]
-        for f in files:
-            run_eda(os.path.join("data/raw", f), args)
+        files = [os.path.join("data/raw", f) for f in os.listdir("data/raw") if f.endswith(".csv")]
+        if files:
+            run_eda_all(files, args)
     elif args.input:
         run_eda(args.input, args)
     else:
@@ -1,10 +1,46 @@
 import streamlit as st
 import pandas as pd
 import os
+import tempfile
 import plotly.express as px
 from ydata_profiling import ProfileReport
 from datetime import datetime
 
+from generate_eda_report import _read_csv, detect_delimiter, frame_key
+
+# -------------------- Cached Computations --------------------
+# Streamlit reruns the whole script on every widget change; these keep the
+# parse and type inference from being redone on each click
+@st.cache_data(show_spinner="📥 Parsing CSV...")
+def load_upload(file_bytes):
+    # The Arrow reader wants a real path, so spill the upload to a temp file first
+    with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as tmp:
+        tmp.write(file_bytes)
+    try:
+        # Read directly rather than via load_dataset: temp paths never hit the disk cache,
+        # and parse errors must raise so st.cache_data doesn't memoise a failure
+        return _read_csv(tmp.name, detect_delimiter(tmp.name))
+    finally:
+        os.remove(tmp.name)
+
+# Not cached: the dtype walk is O(columns), cheaper than hashing the frame
+def column_types(df):
+    num_cols = df.select_dtypes(include='number').columns.tolist()
+    cat_cols = df.select_dtypes(include=['object', 'string', 'category', 'bool']).columns.tolist()
+    date_cols = df.select_dtypes(include=['datetime64', 'datetimetz']).columns.tolist()
+    return num_cols, cat_cols, date_cols
+
+# The leading underscore tells Streamlit not to hash the frame; the upload's
+# file_id identifies it instead
+@st.cache_data
+def top_value_counts(_df, file_id, col):
+    return _df[col].dropna().value_counts().head(20)
+
+# Keyed on frame content, so re-uploading the same CSV skips profiling entirely
+@st.cache_data(hash_funcs={pd.DataFrame: frame_key}, show_spinner="🧠 Profiling dataset...")
+def profile_html(df, title):
+    return ProfileReport(df, title=title, explorative=True).to_html()
+
 # -------------------- Streamlit UI Setup --------------------
 st.set_page_config(page_title="AIBE 3.14 EDA", layout="wide", page_icon="📊")
 
@@ -23,7 +59,7 @@ uploaded_file = st.file_uploader("📁 Upload CSV file", type=["csv"])
 
 if uploaded_file:
     try:
-        df = pd.read_csv(uploaded_file)
+        df = load_upload(uploaded_file.getvalue())
     except Exception as e:
         st.error(f"❌ Failed to read CSV: {e}")
         st.stop()
@@ -39,9 +75,7 @@ if uploaded_file:
     st.subheader("📦 Column Overview")
 
     # Always define column types
-    num_cols = df.select_dtypes(include=['int64', 'float64']).columns.tolist()
-    cat_cols = df.select_dtypes(include=['object', 'category', 'bool']).columns.tolist()
-    date_cols = df.select_dtypes(include=['datetime64[ns]']).columns.tolist()
+    num_cols, cat_cols, date_cols = column_types(df)
 
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -65,11 +99,10 @@ if uploaded_file:
     if cat_cols:
         cat_col = st.selectbox("Choose a categorical column", cat_cols, key="cat")
         try:
-            vc = df[cat_col].dropna().value_counts().head(20).reset_index()
-            vc.columns = [cat_col, 'count']
+            vc = top_value_counts(df, uploaded_file.file_id, cat_col)
 
-            fig1 = px.bar(vc, x=cat_col, y='count',
-                          labels={cat_col: cat_col, 'count': 'Count'},
+            fig1 = px.bar(x=vc.index.astype(str), y=vc.values,
+                          labels={'x': cat_col, 'y': 'Count'},
                           title=f"Top 20 Most Frequent Values in '{cat_col}'")
             st.plotly_chart(fig1, use_container_width=True)
         except Exception as e:
@@ -89,21 +122,20 @@ if uploaded_file:
 
     if st.button("💾 Generate & Save HTML Report"):
         try:
-            profile = ProfileReport(df, title=f"{filename} - EDA Report", explorative=True)
+            html_report = profile_html(df, f"{filename} - EDA Report")
 
             output_dir = f"reports/{filename}"
             os.makedirs(output_dir, exist_ok=True)
 
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             report_path = os.path.join(output_dir, f"{filename}_report_{timestamp}.html")
-            profile.to_file(report_path)
+            with open(report_path, 'w', encoding='utf-8') as f:
+                f.write(html_report)
 
             st.success(f"✅ Report saved to `{report_path}`")
 
             # Display the HTML report in-app
-            with open(report_path, 'r', encoding='utf-8') as f:
-                html_report = f.read()
-                st.components.v1.html(html_report, height=800, scrolling=True)
+            st.components.v1.html(html_report, height=800, scrolling=True)
 
         except Exception as e:
             st.error(f"❌ Failed to generate report: {e}")
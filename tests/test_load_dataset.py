@@ -0,0 +1,50 @@
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "eda"))
+
+import generate_eda_report as eda  # noqa: E402
+
+
+def _write_csv(path, rows=3000):
+    lines = ["id,cat,score"]
+    for i in range(rows):
+        cat = ("", "NA", "n/a", '""', "x", "y")[i % 6]
+        score = "" if i % 5 == 0 else str(i / 10)
+        lines.append(f"{i},{cat},{score}")
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def test_missing_values_match_pandas(tmp_path):
+    path = _write_csv(tmp_path / "data.csv")
+    df = eda.load_dataset(str(path), use_cache=False)
+    expected = pd.read_csv(path)
+    assert df.isna().sum().to_dict() == expected.isna().sum().to_dict()
+    assert "" not in set(df["cat"].dropna())
+
+
+def test_string_columns_are_arrow_backed(tmp_path):
+    path = _write_csv(tmp_path / "data.csv")
+    df = eda.load_dataset(str(path), use_cache=False)
+    assert df["cat"].dtype == eda.STRING_DTYPE
+    assert df["score"].dtype.kind == "f"
+
+
+def test_corrupt_cache_entry_is_a_miss(tmp_path, monkeypatch):
+    monkeypatch.setattr(eda, "CACHE_DIR", str(tmp_path / "cache"))
+    path = _write_csv(tmp_path / "data.csv")
+    first = eda.load_dataset(str(path))
+    (entry,) = (tmp_path / "cache").iterdir()
+    entry.write_bytes(b"not a pickle")
+    again = eda.load_dataset(str(path))
+    assert again is not None
+    pd.testing.assert_frame_equal(again, first)
+
+
+def test_no_cache_writes_nothing(tmp_path, monkeypatch):
+    monkeypatch.setattr(eda, "CACHE_DIR", str(tmp_path / "cache"))
+    eda.load_dataset(str(_write_csv(tmp_path / "data.csv")), use_cache=False)
+    assert not (tmp_path / "cache").exists()
@@ -0,0 +1,50 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "eda"))
+
+import generate_eda_report as eda  # noqa: E402
+
+
+def _frame(rows=5000):
+    rng = np.random.default_rng(0)
+    a = rng.normal(size=rows)
+    return pd.DataFrame({
+        "a": a,
+        "b": a + 0.05 * rng.normal(size=rows),
+        "offset": 1e7 + rng.integers(0, 3, rows),
+        "c": rng.normal(size=rows),
+    })
+
+
+def _assert_matches_pandas(df):
+    expected = df.corr().to_numpy()
+    got = eda.pearson_corr(df).to_numpy()
+    np.testing.assert_allclose(got, expected, atol=1e-5, equal_nan=True)
+
+
+def test_matches_pandas_without_missing_values():
+    _assert_matches_pandas(_frame())
+
+
+def test_matches_pandas_with_missing_values():
+    df = _frame()
+    rng = np.random.default_rng(1)
+    df.loc[rng.random(len(df)) < 0.5, "b"] = np.nan
+    df.loc[::3, "c"] = np.nan
+    _assert_matches_pandas(df)
+
+
+def test_constant_column_is_nan():
+    df = _frame().assign(k=1.0)
+    assert eda.pearson_corr(df)["k"].isna().all()
+
+
+def test_tiled_gram_matches_pandas(monkeypatch):
+    monkeypatch.setattr(eda, "CORR_TILE_COLS", 2)
+    df = _frame()
+    df.loc[::4, "a"] = np.nan
+    _assert_matches_pandas(df)
@@ -0,0 +1,27 @@
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "eda"))
+
+import generate_eda_report as eda  # noqa: E402
+
+
+def _strings(values):
+    return pd.Series(values, dtype=eda.STRING_DTYPE)
+
+
+def test_iso_dates_become_datetimes():
+    df = pd.DataFrame({"when": _strings(["2020-01-01", "2021-06-30", None])})
+    out = eda.smart_convert_columns(df)
+    assert out["when"].dtype.kind == "M"
+    assert out["when"].isna().sum() == 1
+
+
+def test_decisions_do_not_leak_between_frames():
+    dates = pd.DataFrame({"col": _strings(["2020-01-01", "2020-01-02"])})
+    labels = pd.DataFrame({"col": _strings(["alpha-beta", "gamma-delt"])})
+    eda.smart_convert_columns(dates)
+    out = eda.smart_convert_columns(labels)
+    assert out["col"].tolist() == ["alpha-beta", "gamma-delt"]
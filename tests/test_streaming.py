@@ -0,0 +1,40 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "eda"))
+
+import generate_eda_report as eda  # noqa: E402
+
+
+@pytest.mark.filterwarnings("error::RuntimeWarning")
+def test_streaming_corr_matches_pandas(tmp_path, monkeypatch):
+    rng = np.random.default_rng(0)
+    rows = 1000
+    a = rng.normal(size=rows)
+    df = pd.DataFrame({
+        "a": a,
+        "b": a + 0.1 * rng.normal(size=rows),
+        "c": rng.normal(size=rows) * 100 + 1e6,
+        "late": rng.normal(size=rows),
+        "label": rng.choice(["x", "y"], size=rows),
+    })
+    df.loc[rng.random(rows) < 0.3, "b"] = np.nan
+    df.loc[:149, "late"] = np.nan  # all-NaN across the whole first chunk
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+
+    captured = {}
+    monkeypatch.setattr(eda, "STREAM_CHUNK_ROWS", 150)
+    monkeypatch.setattr(eda, "REPORTS_DIR", str(tmp_path / "reports"))
+    monkeypatch.setattr(eda, "save_correlation_heatmap",
+                        lambda corr, *args, **kwargs: captured.setdefault("corr", corr))
+    eda.run_eda_streaming(str(path))
+
+    expected = df.select_dtypes(include="number").corr()
+    got = captured["corr"]
+    assert list(got.columns) == list(expected.columns)
+    np.testing.assert_allclose(got.to_numpy(), expected.to_numpy(), atol=1e-9)